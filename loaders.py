@@ -15,26 +15,79 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import csv
+import functools
+import hashlib
+import io
+import mmap
 import os
-from models import Table, TableRow, TableDirectory
+import pickle
+import re
+import sys
+import tempfile
+from typing import Callable, Iterator, List, Optional
+from models import LazyTable, Table, TableRow, TableDirectory
 from logger import g_logger
 
 
-class TableLoader(ABC):
-    """Abstract base class for table loaders."""
+# Default location for the parsed table cache, following the XDG layout.
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'ttrpg-table-manager'
+)
+# Bump whenever the pickled layout of the models changes.
+CACHE_FORMAT_VERSION = 11
+# pickle reads and writes in many small chunks; a 1 MiB buffer keeps a
+# large tree down to a handful of read()/write() calls.
+CACHE_BUFFER_SIZE = 1 << 20
 
-    @abstractmethod
-    def load(self, source: str) -> TableDirectory:
-        """Load tables from a source (file or directory)."""
-        pass
+# Eager loads of fewer files than this are parsed on threads, which start
+# faster than worker processes
+PROCESS_POOL_MIN_FILES = 4
+
+# Range cell of a table row: a single value ("5") or an inclusive span ("1-4")
+_RANGE_RE = re.compile(r'^\s*(\d+)\s*(?:-\s*(\d+))?\s*$')
+# Table keeps range bounds in array('q') columns. The regex only takes
+# digits, so the int64 maximum is the one bound a value can break.
+_RANGE_MAX = 2**63 - 1
 
 
-class CSVTableLoader(TableLoader):
+class CSVTableLoader:
     """Loads tables from CSV files."""
 
+    def __init__(self, cache_dir: Optional[str] = None, lazy: bool = True):
+        # Directory where loaded trees are pickled; None disables the cache.
+        self.cache_dir = cache_dir
+        # When set, tables found in a directory are parsed on first use.
+        self.lazy = lazy
+
     def load(self, source: str) -> TableDirectory:
+        """Load tables from a source (file or directory)."""
+        cache_path = cache_key = None
+        # A lazy directory load caches the tree of unparsed placeholders,
+        # which spares the next run the walk; an eager load caches the
+        # parsed tables. Lazy loads reuse either, eager loads only the latter.
+        lazy_tree = self.lazy and os.path.isdir(source)
+        if self.cache_dir and os.path.exists(source):
+            # One cache file per source, holding the key it was built for, so
+            # a changed tree replaces its pickle instead of adding another.
+            source_id = hashlib.blake2b(
+                os.path.abspath(source).encode('utf-8'), digest_size=16
+            ).hexdigest()
+            cache_path = os.path.join(self.cache_dir, f"{source_id}.pkl")
+            try:
+                cache_key = self._cache_key(source)
+            except OSError as e:
+                # Entries vanishing mid-walk: load normally, skip the cache
+                g_logger.warning(f"Not caching tables for {source}: {e}")
+                cache_path = None
+            else:
+                cached = self._read_cache(cache_path, cache_key, lazy_tree)
+                if cached is not None:
+                    g_logger.info(f"Loaded tables for {source} from cache {cache_path}")
+                    return cached
+
         root_name = os.path.basename(os.path.abspath(source))
         root_dir = TableDirectory(name=root_name)
 
@@ -45,66 +98,266 @@ class CSVTableLoader(TableLoader):
             except Exception as e:
                 g_logger.error(f"Failed to load table from {source}: {e}")
         elif os.path.isdir(source):
-            self._load_recursive(source, root_dir)
+            # Placeholders may be read back from the cache by a run started
+            # elsewhere, so they keep absolute paths
+            self._load_recursive(os.path.abspath(source), root_dir)
         else:
             g_logger.error(f"Source not found: {source}")
 
+        if cache_path:
+            self._write_cache(cache_path, cache_key, lazy_tree, root_dir)
+
         return root_dir
 
+    def _cache_key(self, source: str) -> str:
+        """Hash the source path with the size and mtime of every file below it."""
+        abs_source = os.path.abspath(source)
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{CACHE_FORMAT_VERSION}|{abs_source}\n".encode('utf-8'))
+
+        if os.path.isdir(abs_source):
+            self._hash_tree(abs_source, digest)
+        else:
+            st = os.stat(abs_source)
+            digest.update(f"{st.st_size}|{st.st_mtime_ns}\n".encode('utf-8'))
+
+        return digest.hexdigest()
+
+    def _hash_tree(self, current_path: str, digest):
+        # Same walk and filter as _iter_csv_paths: only entries the loader
+        # would load count, so editor swap files, .git churn or dangling
+        # symlinks neither invalidate the cache nor get stat()ed. Listing
+        # every loaded path already catches added, removed and renamed
+        # entries, so folders contribute their path only.
+        with os.scandir(current_path) as it:
+            entries = sorted(
+                (entry for entry in it if not entry.name.startswith('.')),
+                key=lambda entry: entry.name
+            )
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith('.csv'):
+                st = entry.stat()
+                digest.update(f"{entry.path}|{st.st_size}|{st.st_mtime_ns}\n".encode('utf-8'))
+            elif entry.is_dir():
+                digest.update(f"{entry.path}/\n".encode('utf-8'))
+                self._hash_tree(entry.path, digest)
+
+    def _read_cache(self, cache_path: str, cache_key: str,
+                    accept_lazy: bool) -> Optional[TableDirectory]:
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb', buffering=CACHE_BUFFER_SIZE) as f:
+                stored_key, lazy_tree, root_dir = pickle.load(f)
+        except Exception as e:
+            g_logger.warning(f"Ignoring unreadable table cache {cache_path}: {e}")
+            return None
+        if stored_key != cache_key or (lazy_tree and not accept_lazy):
+            return None
+        return root_dir
+
+    def _write_cache(self, cache_path: str, cache_key: str, lazy_tree: bool,
+                     root_dir: TableDirectory):
+        cache_dir = os.path.dirname(cache_path)
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file and rename it into place, so a crash
+            # or a concurrent run never leaves a truncated pickle behind.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with open(fd, 'wb', buffering=CACHE_BUFFER_SIZE) as f:
+                pickle.dump((cache_key, lazy_tree, root_dir), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            g_logger.warning(f"Failed to write table cache {cache_path}: {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
     def _load_recursive(self, current_path: str, current_dir: TableDirectory):
-        # Load files in current directory
-        for item in os.listdir(current_path):
-            full_path = os.path.join(current_path, item)
-            if os.path.isfile(full_path) and item.endswith('.csv'):
-                try:
-                    table = self._load_file(full_path)
-                    current_dir.add_table(table)
-                except Exception as e:
-                    g_logger.error(f"Failed to load table from {full_path}: {e}")
-            elif os.path.isdir(full_path):
-                # Create subdirectory node
-                subdir = TableDirectory(name=item)
-                current_dir.add_subdir(subdir)
-                # Recurse
-                self._load_recursive(full_path, subdir)
+        # Build the directory tree first, then attach lazy placeholders or
+        # parse the collected files in parallel. Tables are attached in
+        # discovery order, from this thread.
+        csv_paths = list(self._iter_csv_paths(current_path, current_dir))
+        if not csv_paths:
+            return
 
-    def _load_file(self, filepath: str) -> Table:
-        filename = os.path.basename(filepath)
-        table_name = os.path.splitext(filename)[0]
+        if self.lazy:
+            for node, full_path in csv_paths:
+                node.add_table(self._load_lazy(full_path))
+            return
 
-        with open(filepath, 'r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            headers = next(reader, None)
+        # Parsing is CPU bound, so threads mostly take turns on the GIL. Fan
+        # out to worker processes once there are enough files to pay for
+        # starting them. Workers only parse; logging and Table construction
+        # happen here.
+        executor = None
+        if len(csv_paths) >= PROCESS_POOL_MIN_FILES:
+            try:
+                executor = ProcessPoolExecutor()
+            except (ImportError, NotImplementedError, OSError) as e:
+                # No working semaphores on this platform
+                g_logger.warning(f"Parsing tables on threads, worker processes unavailable: {e}")
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=os.cpu_count())
 
-            if not headers or len(headers) < 2:
-                raise ValueError("CSV must have at least a header row and two columns")
+        with executor:
+            futures = [
+                (node, full_path, executor.submit(self._read_records, full_path))
+                for node, full_path in csv_paths
+            ]
+            for node, full_path, future in futures:
+                self._attach_table(node, full_path, future.result)
 
-            rows = []
-            for line_num, row_data in enumerate(reader, start=2):
-                if not row_data:
+    def _attach_table(self, node: TableDirectory, filepath: str,
+                      read: Callable[[], tuple[List[str], List[TableRow], List[int]]]):
+        try:
+            headers, rows, invalid_rows = read()
+        except Exception as e:
+            g_logger.error(f"Failed to load table from {filepath}: {e}")
+            return
+        self._log_parse_result(filepath, rows, invalid_rows)
+        node.add_table(Table(self._table_name(filepath), headers, rows))
+
+    def _iter_csv_paths(self, current_path: str, current_dir: TableDirectory
+                        ) -> Iterator[tuple[TableDirectory, str]]:
+        """Yield (directory node, file path) for every CSV below current_path.
+
+        Subdirectory nodes are created and attached while walking.
+        """
+        # scandir reports the entry type along with the name, so no extra
+        # stat() per entry is needed to tell files from directories.
+        with os.scandir(current_path) as entries:
+            for entry in entries:
+                # Hidden entries are editor swap files, macOS "._" resource
+                # forks, .git and the like, never tables.
+                if entry.name.startswith('.'):
                     continue
+                if entry.is_file() and entry.name.endswith('.csv'):
+                    yield current_dir, entry.path
+                elif entry.is_dir():
+                    # Create subdirectory node
+                    subdir = TableDirectory(name=entry.name)
+                    current_dir.add_subdir(subdir)
+                    # Recurse
+                    yield from self._iter_csv_paths(entry.path, subdir)
+
+    def _load_file(self, filepath: str) -> Table:
+        headers, rows = self._parse_file(filepath)
+        return Table(self._table_name(filepath), headers, rows)
+
+    def _load_lazy(self, filepath: str) -> LazyTable:
+        return LazyTable(
+            self._table_name(filepath),
+            functools.partial(self._parse_file_or_empty, filepath)
+        )
+
+    def _parse_file_or_empty(self, filepath: str) -> tuple[List[str], List[TableRow]]:
+        # Lazy tables are parsed from the TUI, where an exception would end
+        # the session: log the failure and show an empty table instead.
+        try:
+            return self._parse_file(filepath)
+        except Exception as e:
+            g_logger.error(f"Failed to load table from {filepath}: {e}")
+            return [], []
+
+    def _table_name(self, filepath: str) -> str:
+        return os.path.splitext(os.path.basename(filepath))[0]
+
+    def _parse_file(self, filepath: str) -> tuple[List[str], List[TableRow]]:
+        """Parse a CSV file into its headers and rows."""
+        headers, rows, invalid_rows = self._read_records(filepath)
+        self._log_parse_result(filepath, rows, invalid_rows)
+        return headers, rows
+
+    def _log_parse_result(self, filepath: str, rows: List[TableRow], invalid_rows: List[int]):
+        # One record per file rather than one per bad row
+        if invalid_rows:
+            shown = ", ".join(str(n) for n in invalid_rows[:5])
+            more = "..." if len(invalid_rows) > 5 else ""
+            g_logger.warning(
+                f"Skipping {len(invalid_rows)} invalid rows in {filepath} (rows {shown}{more})"
+            )
+        g_logger.debug(
+            f"Loaded table '{self._table_name(filepath)}' with {len(rows)} rows from {filepath}"
+        )
+
+    @staticmethod
+    def _read_records(filepath: str) -> tuple[List[str], List[TableRow], List[int]]:
+        """Parse a CSV file into headers, rows and the numbers of invalid rows.
 
-                # First column is the range (e.g., "1", "2-5")
-                range_str = row_data[0].strip()
-                try:
-                    range_start, range_end = self._parse_range(range_str)
-                    content = row_data[1:]
-                    rows.append(TableRow(range_start, range_end, content))
-                except ValueError as e:
-                    g_logger.warning(
-                        f"Skipping invalid row {line_num} in {filepath}: {e}"
-                    )
-
-            g_logger.info(
-                f"Loaded table '{table_name}' with {len(rows)} rows from {filepath}"
+        Does not log, so it can run in a worker process.
+        """
+        text = CSVTableLoader._read_text(filepath)
+        if '"' in text:
+            reader = csv.reader(io.StringIO(text, newline=''))
+        else:
+            # Without quoting every record is one line, and str.split does the
+            # tokenizing without csv.reader's per-character state machine.
+            # Blank lines become [] just like csv.reader reports them.
+            reader = (
+                line.rstrip('\r').split(',') if line.strip() else []
+                for line in text.split('\n')
             )
-            return Table(table_name, headers, rows)
+        headers = next(reader, None)
+
+        if not headers or len(headers) < 2:
+            raise ValueError("CSV must have at least a header row and two columns")
+
+        # Tables tend to share column names ("Roll", "Result", ...), keep a
+        # single copy of each across the loaded tree.
+        headers = [sys.intern(h) for h in headers]
+
+        # Bind the per-row callables once, the loop body runs for every
+        # line of the file.  The range is matched inline with the same regex
+        # and bound as _parse_range, so bad rows cost a None check instead
+        # of an exception.
+        rows = []
+        invalid_rows = []
+        append_row = rows.append
+        match_range = _RANGE_RE.match
+        intern = sys.intern
+        for line_num, row_data in enumerate(reader, start=2):
+            if not row_data:
+                continue
+
+            # First column is the range (e.g., "1", "2-5")
+            m = match_range(row_data[0])
+            if m is None:
+                invalid_rows.append(line_num)
+                continue
+            start, end = m.groups()
+            range_start = int(start)
+            range_end = int(end) if end else range_start
+            if range_start > _RANGE_MAX or range_end > _RANGE_MAX:
+                invalid_rows.append(line_num)
+                continue
+            # Cells like "Normal" or "-" repeat across rows and tables
+            content = [intern(cell) for cell in row_data[1:]]
+            append_row(TableRow(range_start, range_end, content))
+
+        return headers, rows, invalid_rows
+
+    @staticmethod
+    def _read_text(filepath: str) -> str:
+        """Read a whole UTF-8 file through a read-only memory map."""
+        with open(filepath, 'rb') as f:
+            # mmap refuses zero-length files
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return str(mapped, 'utf-8')
 
-    def _parse_range(self, range_str: str) -> tuple[int, int]:
+    @staticmethod
+    def _parse_range(range_str: str) -> tuple[int, int]:
         """Parse a range string like '5' or '1-4' into (start, end)."""
-        if '-' in range_str:
-            parts = range_str.split('-')
-            if len(parts) == 2:
-                return int(parts[0]), int(parts[1])
+        match = _RANGE_RE.match(range_str)
+        if not match:
+            raise ValueError(f"invalid range {range_str!r}")
 
-        return int(range_str), int(range_str)
+        start, end = match.groups()
+        start = int(start)
+        end = int(end) if end else start
+        if start > _RANGE_MAX or end > _RANGE_MAX:
+            raise ValueError(f"range {range_str!r} out of bounds")
+        return start, end
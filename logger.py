@@ -16,17 +16,78 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import atexit
+import contextlib
 import logging
-from datetime import datetime
-import pytz
+import logging.handlers
+import multiprocessing
+import queue
+import time
+from datetime import datetime, timezone
+
+
+# The local UTC offset is looked up at most once a minute, which still
+# follows DST changes without resolving the timezone for every record.
+_TZ_REFRESH_SECONDS = 60
+_tz_suffix = ''
+_tz_next_refresh = 0.0
+
+
+def _local_tz_suffix():
+    global _tz_suffix, _tz_next_refresh
+    now = time.monotonic()
+    if now >= _tz_next_refresh:
+        local_dt = datetime.now(timezone.utc).astimezone()
+        _tz_suffix = local_dt.strftime('%z')
+        _tz_next_refresh = now + _TZ_REFRESH_SECONDS
+    return _tz_suffix
+
+
+# Background thread writing queued records to the file and console handlers
+g_log_listener = None
+
+
+def _stop_log_listener():
+    global g_log_listener
+    if g_log_listener is not None:
+        g_log_listener.stop()
+        for handler in g_log_listener.handlers:
+            handler.close()
+        g_log_listener = None
+
+
+@contextlib.contextmanager
+def console_logging_suspended():
+    """Send records to the log file only while the block runs.
+
+    Used while curses owns the terminal, where console output would be
+    drawn over the screen.
+    """
+    console_handlers = []
+    if g_log_listener is not None:
+        console_handlers = [
+            h for h in g_log_listener.handlers
+            if isinstance(h, logging.StreamHandler)
+            and not isinstance(h, logging.FileHandler)
+        ]
+    saved_levels = [h.level for h in console_handlers]
+    for handler in console_handlers:
+        handler.setLevel(logging.CRITICAL + 1)
+    try:
+        yield
+    finally:
+        for handler, level in zip(console_handlers, saved_levels):
+            handler.setLevel(level)
 
 
 def setup_logging(log_file="ttrp.table.mng.log", verbose=False):
-    logger = logging.getLogger("udp_ping")
+    global g_log_listener
+    logger = logging.getLogger("ttrpg_table_manager")
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
 
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_log_listener()
 
     formatter = logging.Formatter(
         "[%(asctime)s %(tz)s] [%(threadName)s] [%(levelname)s] %(message)s",
@@ -35,23 +96,37 @@ def setup_logging(log_file="ttrp.table.mng.log", verbose=False):
 
     class TimezoneFilter(logging.Filter):
         def filter(self, record):
-            local_dt = datetime.now(pytz.timezone('UTC')).astimezone()
-            record.tz = local_dt.strftime('%z')
+            record.tz = _local_tz_suffix()
             return True
 
     file_handler = logging.FileHandler(log_file)
     file_handler.setFormatter(formatter)
     file_handler.addFilter(TimezoneFilter())
-    logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
     console_handler.addFilter(TimezoneFilter())
-    logger.addHandler(console_handler)
+
+    # Callers only pay for a queue put; formatting and I/O happen on the
+    # listener thread.
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    g_log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    g_log_listener.start()
 
     logger.propagate = False
 
     return logger
 
 
-g_logger = setup_logging(log_file='ttrpg.table.logger.log', verbose=True)
+atexit.register(_stop_log_listener)
+
+# Table parsing workers started with spawn or forkserver import this module
+# again. They never log, so only the main process opens the log file and
+# starts the listener thread.
+if multiprocessing.parent_process() is None:
+    g_logger = setup_logging(log_file='ttrpg.table.logger.log', verbose=True)
+else:
+    g_logger = logging.getLogger("ttrpg_table_manager")
@@ -18,8 +18,8 @@
 
 import argparse
 import curses
-from loaders import CSVTableLoader
-from logger import g_logger
+from loaders import CSVTableLoader, DEFAULT_CACHE_DIR
+from logger import g_logger, console_logging_suspended
 from views import run_tui, print_logo
 
 def parse_cli_args():
@@ -39,6 +39,11 @@ def parse_cli_args():
         help="Path to a custom theme JSON file.",
         default=None
     )
+    parser.add_argument(
+        "-e", "--eager",
+        help="Parse all tables at startup and cache them for the next run.",
+        action="store_true"
+    )
     return parser.parse_args()
 
 
@@ -59,7 +64,7 @@ def main():
     # Sticking to minimal requirement compliance + TUI.
     
     path = args.path
-    loader = CSVTableLoader()
+    loader = CSVTableLoader(cache_dir=DEFAULT_CACHE_DIR, lazy=not args.eager)
 
     # If no path provided, ask interactively using input()
     # This happens BEFORE TUI init, so acceptable.
@@ -82,9 +87,11 @@ def main():
         g_logger.warning("No tables loaded.")
         return
 
-    # Start TUI
+    # Start TUI. Tables are parsed lazily from inside it, so keep log
+    # records off the screen until it exits.
     try:
-        curses.wrapper(run_tui, root_dir, args.logo, args.theme)
+        with console_logging_suspended():
+            curses.wrapper(run_tui, root_dir, args.logo, args.theme)
     except Exception as e:
         # If terminal is too small or other curses error
         print(f"TUI Error: {e}")
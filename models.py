@@ -15,11 +15,19 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from array import array
+import bisect
+import functools
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Sequence, Tuple
+from logger import g_logger
 
 
-@dataclass
+# Widest value range (max - min) for which Table builds a direct lookup list
+LOOKUP_TABLE_MAX_SPAN = 10_000
+
+
+@dataclass(slots=True)
 class TableRow:
     """Represents a single row in a TTRPG table."""
     range_start: int
@@ -30,33 +38,243 @@ class TableRow:
         """Check if the value falls within the row's range."""
         return self.range_start <= value <= self.range_end
 
+    def range_display(self) -> str:
+        """Format the range as shown to the user, e.g. '5' or '1-4'."""
+        if self.range_start == self.range_end:
+            return f"{self.range_start}"
+        return f"{self.range_start}-{self.range_end}"
+
+
+class IntervalTree:
+    """Static augmented interval tree answering "which ranges contain x".
+
+    The tree is implicit over intervals sorted by start: the middle of
+    each slice is a node and the two halves are its subtrees. Every node
+    also stores the largest end in its subtree, so a query skips whole
+    subtrees that stop before the value, giving O(log n + k).
+    """
+    def __init__(self, starts: Sequence[int], ends: Sequence[int], payloads: Sequence[int]):
+        self._starts = starts
+        self._ends = ends
+        self._payloads = payloads
+        self._max_end = array('q', ends)
+        if starts:
+            self._build(0, len(starts))
+
+    def _build(self, lo: int, hi: int) -> int:
+        # Depth is log2(n), recursion is fine here
+        mid = (lo + hi) // 2
+        max_end = self._ends[mid]
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def query(self, value: int) -> List[int]:
+        """Return the payloads of all intervals containing value."""
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        found = []
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if max_end[mid] < value:
+                continue
+            stack.append((lo, mid))
+            # Everything right of mid starts at or after starts[mid]
+            if starts[mid] <= value:
+                if ends[mid] >= value:
+                    found.append(self._payloads[mid])
+                stack.append((mid + 1, hi))
+        return found
+
 
 class Table:
     """Represents a TTRPG table."""
+    # (column widths, lines) from the last render_rows call
+    _rendered_rows = None
+    # (column widths, max length, lines) from the last render_rows_truncated call
+    _truncated_rows = None
+
     def __init__(self, name: str, headers: List[str], rows: List[TableRow]):
         self.name = name
         self.headers = headers
         self.rows = rows
+        # Range bounds kept column-wise in typed arrays sorted by range
+        # start, so a lookup is a binary search over contiguous machine
+        # ints. _order maps a sorted position back to its index in rows,
+        # which keeps file order.
+        order = sorted(range(len(rows)), key=lambda i: rows[i].range_start)
+        self._order = array('q', order)
+        self._starts = array('q', (rows[i].range_start for i in order))
+        self._ends = array('q', (rows[i].range_end for i in order))
+        # Starts are sorted, so only the ends need a scan
+        self._bounds = (self._starts[0], max(self._ends)) if rows else (0, 0)
+        # Binary search only finds the first match if no ranges overlap
+        self._disjoint = all(
+            end < start for end, start in zip(self._ends, self._starts[1:])
+        )
+        self._build_lookup_table()
+        # Wide tables with overlapping ranges get an interval tree instead of
+        # scanning every row that starts below the value
+        self._tree = None
+        if self._lut is None and not self._disjoint:
+            self._tree = IntervalTree(self._starts, self._ends, self._order)
+        self._init_query_cache()
+
+    def _build_lookup_table(self):
+        # Dice tables cover small dense ranges (d20, d100, ...), so map every
+        # covered value straight to its row. Wider tables keep the search.
+        self._lut = None
+        self._lut_min = 0
+        if not self.rows:
+            return
+        min_val, max_val = self._bounds
+        if max_val - min_val >= LOOKUP_TABLE_MAX_SPAN:
+            return
+
+        lut = [None] * (max_val - min_val + 1)
+        # Fill in reverse file order so the first matching row wins overlaps
+        for row in reversed(self.rows):
+            if row.range_start <= row.range_end:
+                lo, hi = row.range_start - min_val, row.range_end - min_val + 1
+                lut[lo:hi] = [row] * (hi - lo)
+        self._lut = lut
+        self._lut_min = min_val
+
+    def _init_query_cache(self):
+        # Players re-roll the same values all the time; remember the answer
+        # of the searching paths. A lookup list is already O(1) and would
+        # only pay for the hashing. The wrapper is per instance and is
+        # rebuilt rather than pickled.
+        if self._lut is not None:
+            self.query = self._query_impl
+        else:
+            self.query = functools.lru_cache(maxsize=256)(self._query_impl)
+
+    def _query_impl(self, value: int) -> Optional[TableRow]:
+        """Find the row that matches the given value.
+
+        Called through `query`, which caches the result per value unless
+        the table has a lookup list.
+        """
+        if self._lut is not None:
+            idx = value - self._lut_min
+            return self._lut[idx] if 0 <= idx < len(self._lut) else None
+
+        # Mistyped rolls usually fall outside the table altogether
+        min_val, max_val = self._bounds
+        if value < min_val or value > max_val:
+            return None
+
+        if self._disjoint:
+            i = bisect.bisect_right(self._starts, value) - 1
+            if i >= 0 and self._ends[i] >= value:
+                return self.rows[self._order[i]]
+            return None
+
+        # Overlapping ranges: the first covering row in file order wins
+        matches = self._tree.query(value)
+        return self.rows[min(matches)] if matches else None
 
-    def query(self, value: int) -> Optional[TableRow]:
-        """Find the row that matches the given value."""
-        for row in self.rows:
-            if row.matches(value):
-                return row
-        return None
+    @functools.cached_property
+    def display_rows(self) -> List[List[str]]:
+        """Rows as display cells: the formatted range followed by the content."""
+        return [[row.range_display()] + row.content for row in self.rows]
+
+    def render_rows(self, col_widths: Sequence[int]) -> List[str]:
+        """Display lines for all rows, cells padded to `col_widths`.
+
+        The lines for the last widths asked for are kept, so paging through
+        a dump only formats the table once.
+        """
+        widths = tuple(col_widths)
+        cached = self._rendered_rows
+        if cached is not None and cached[0] == widths:
+            return cached[1]
+
+        n = len(widths)
+        lines = [
+            " | ".join(cell.ljust(widths[i]) if i < n else cell
+                       for i, cell in enumerate(cells))
+            for cells in self.display_rows
+        ]
+        self._rendered_rows = (widths, lines)
+        return lines
+
+    def render_rows_truncated(self, col_widths: Sequence[int], max_len: int) -> Tuple[str, ...]:
+        """render_rows cut to at most `max_len` characters, e.g. the screen width.
+
+        Kept for the last widths and length, so they are only recut when
+        the terminal is resized.
+        """
+        widths = tuple(col_widths)
+        cached = self._truncated_rows
+        if cached is not None and cached[0] == widths and cached[1] == max_len:
+            return cached[2]
+
+        lines = tuple(line[:max_len] for line in self.render_rows(widths))
+        self._truncated_rows = (widths, max_len, lines)
+        return lines
 
     def get_range_bounds(self) -> tuple[int, int]:
         """Return the minimum and maximum values covered by the table."""
-        if not self.rows:
-            return 0, 0
-        min_val = min(row.range_start for row in self.rows)
-        max_val = max(row.range_end for row in self.rows)
-        return min_val, max_val
+        return self._bounds
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('query', None)
+        state.pop('_rendered_rows', None)
+        state.pop('_truncated_rows', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_query_cache()
 
     def __repr__(self):
         return f"<Table name='{self.name}' rows={len(self.rows)}>"
 
 
+class LazyTable(Table):
+    """A table whose rows are parsed on first use.
+
+    Only the name is known up front. The first access to any other
+    attribute calls `load`, which returns (headers, rows), and the
+    instance then becomes a plain Table.
+    """
+    def __init__(self, name: str, load: Callable[[], Tuple[List[str], List[TableRow]]]):
+        self.name = name
+        self._load = load
+
+    def __getattr__(self, attr):
+        # Only reached for attributes not set yet. Special names are looked
+        # up by pickle and copy and must not trigger parsing.
+        if attr.startswith('__') or '_load' not in self.__dict__:
+            raise AttributeError(attr)
+        headers, rows = self.__dict__.pop('_load')()
+        self.__class__ = Table
+        try:
+            Table.__init__(self, self.name, headers, rows)
+        except Exception as e:
+            # Raised from whatever attribute the TUI touched first: fall
+            # back to an empty table, like a file that fails to parse.
+            g_logger.error(f"Failed to build table '{self.name}': {e}")
+            Table.__init__(self, self.name, [], [])
+        return getattr(self, attr)
+
+    def __setstate__(self, state):
+        # Nothing to cache until the table is loaded
+        self.__dict__.update(state)
+
+    def __repr__(self):
+        return f"<LazyTable name='{self.name}'>"
+
+
 @dataclass
 class TableDirectory:
     """Represents a directory containing tables and subdirectories."""
@@ -64,10 +282,25 @@ class TableDirectory:
     tables: List[Table] = field(default_factory=list)
     subdirs: Dict[str, 'TableDirectory'] = field(default_factory=dict)
     parent: Optional['TableDirectory'] = None
+    _sorted_subdir_names: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # Browser listing built by views.get_items_for_dir, reset on change
+    _items_cache: Optional[List[Tuple]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def add_table(self, table: Table):
         self.tables.append(table)
+        self._items_cache = None
 
     def add_subdir(self, subdir: 'TableDirectory'):
         self.subdirs[subdir.name] = subdir
         subdir.parent = self
+        self._sorted_subdir_names = None
+        self._items_cache = None
+
+    @property
+    def sorted_subdir_names(self) -> List[str]:
+        """Subdirectory names in sorted order, computed once per change."""
+        if self._sorted_subdir_names is None:
+            self._sorted_subdir_names = sorted(self.subdirs)
+        return self._sorted_subdir_names
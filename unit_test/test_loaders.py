@@ -20,8 +20,10 @@ import unittest
 import os
 import tempfile
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
 from loaders import CSVTableLoader
-from models import TableDirectory, Table
+from models import TableDirectory, Table, LazyTable
 
 
 class TestCSVTableLoader(unittest.TestCase):
@@ -36,8 +38,28 @@ class TestCSVTableLoader(unittest.TestCase):
         self.assertEqual(self.loader._parse_range("5"), (5, 5))
         self.assertEqual(self.loader._parse_range("1-4"), (1, 4))
         self.assertEqual(self.loader._parse_range("10-20"), (10, 20))
-        with self.assertRaises(ValueError):
-            self.loader._parse_range("invalid")
+        self.assertEqual(self.loader._parse_range(" 3 - 6 "), (3, 6))
+        self.assertEqual(self.loader._parse_range("02-03"), (2, 3))
+        for bad in ("invalid", "", "1-", "-4", "1-2-3", "1.5"):
+            with self.assertRaises(ValueError):
+                self.loader._parse_range(bad)
+
+    def test_read_records_ranges(self):
+        filepath = os.path.join(self.test_dir, "ranges.csv")
+        with open(filepath, "w") as f:
+            f.write(
+                "Range,Result\n"
+                "5,A\n1-4,B\n10-20,C\n 3 - 6 ,D\n02-03,E\n"
+                "invalid,X\n,X\n1-,X\n-4,X\n1-2-3,X\n1.5,X\n"
+            )
+        headers, rows, invalid_rows = CSVTableLoader._read_records(filepath)
+        self.assertEqual(headers, ["Range", "Result"])
+        self.assertEqual(
+            [(r.range_start, r.range_end, r.content) for r in rows],
+            [(5, 5, ["A"]), (1, 4, ["B"]), (10, 20, ["C"]),
+             (3, 6, ["D"]), (2, 3, ["E"])]
+        )
+        self.assertEqual(invalid_rows, [7, 8, 9, 10, 11, 12])
 
     def test_load_file_valid(self):
         filepath = os.path.join(self.test_dir, "test.csv")
@@ -50,6 +72,39 @@ class TestCSVTableLoader(unittest.TestCase):
         self.assertEqual(table.rows[0].range_start, 1)
         self.assertEqual(table.rows[1].range_end, 5)
 
+    def test_load_file_quoted_and_unquoted(self):
+        quoted = os.path.join(self.test_dir, "quoted.csv")
+        with open(quoted, "w") as f:
+            f.write('Range,Result\n1,"One, two"\n')
+        plain = os.path.join(self.test_dir, "plain.csv")
+        with open(plain, "w") as f:
+            f.write("Range,Result\r\n1,One\r\n\r\n2-3,Two\r\n")
+
+        self.assertEqual(self.loader._load_file(quoted).rows[0].content, ["One, two"])
+        table = self.loader._load_file(plain)
+        self.assertEqual(table.headers, ["Range", "Result"])
+        self.assertEqual([r.content for r in table.rows], [["One"], ["Two"]])
+
+    def test_load_file_interns_cells(self):
+        filepath = os.path.join(self.test_dir, "repeats.csv")
+        with open(filepath, "w") as f:
+            f.write("Range,Result\n1,Normal\n2,Normal\n")
+
+        first, second = self.loader._load_file(filepath).rows
+        self.assertIs(first.content[0], second.content[0])
+
+    def test_load_file_oversized_range(self):
+        filepath = os.path.join(self.test_dir, "huge.csv")
+        with open(filepath, "w") as f:
+            f.write("Range,Result\n1,One\n2-99999999999999999999,Huge\n"
+                    "9223372036854775807,Max\n")
+
+        headers, rows, invalid_rows = CSVTableLoader._read_records(filepath)
+        self.assertEqual([r.content for r in rows], [["One"], ["Max"]])
+        self.assertEqual(invalid_rows, [3])
+        table = self.loader._load_file(filepath)
+        self.assertEqual(table.query(1).content, ["One"])
+
     def test_load_file_invalid_structure(self):
         filepath = os.path.join(self.test_dir, "bad.csv")
         with open(filepath, "w") as f:
@@ -84,6 +139,207 @@ class TestCSVTableLoader(unittest.TestCase):
         self.assertEqual(len(sub.tables), 1)
         self.assertEqual(sub.tables[0].name, "table2")
 
+    def test_load_recursive_skips_hidden(self):
+        with open(os.path.join(self.test_dir, "table1.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+        with open(os.path.join(self.test_dir, "._table1.csv"), "wb") as f:
+            f.write(b"\x00\x05\x16\x07")
+        hidden = os.path.join(self.test_dir, ".hidden")
+        os.mkdir(hidden)
+        with open(os.path.join(hidden, "table2.csv"), "w") as f:
+            f.write("R,V\n2,B\n")
+
+        root_dir = self.loader.load(self.test_dir)
+        self.assertEqual([t.name for t in root_dir.tables], ["table1"])
+        self.assertEqual(root_dir.subdirs, {})
+
+    def test_load_recursive_lazy(self):
+        with open(os.path.join(self.test_dir, "table1.csv"), "w") as f:
+            f.write("R,V\n1,A\n2-3,B\n")
+
+        root_dir = self.loader.load(self.test_dir)
+        table = root_dir.tables[0]
+        self.assertIsInstance(table, LazyTable)
+        self.assertEqual(table.name, "table1")
+
+        self.assertEqual(table.query(2).content, ["B"])
+        self.assertIs(type(table), Table)
+        self.assertEqual(len(table.rows), 2)
+
+    def test_load_lazy_invalid_file(self):
+        with open(os.path.join(self.test_dir, "bad.csv"), "w") as f:
+            f.write("JustHeader\n")
+
+        root_dir = self.loader.load(self.test_dir)
+        self.assertEqual(len(root_dir.tables), 1)
+        self.assertEqual(root_dir.tables[0].rows, [])
+
+    def test_load_recursive_eager_skips_invalid_file(self):
+        with open(os.path.join(self.test_dir, "bad.csv"), "w") as f:
+            f.write("JustHeader\n")
+        with open(os.path.join(self.test_dir, "good.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+
+        root_dir = CSVTableLoader(lazy=False).load(self.test_dir)
+        self.assertEqual([t.name for t in root_dir.tables], ["good"])
+        self.assertIs(type(root_dir.tables[0]), Table)
+
+    def test_load_recursive_eager_process_pool(self):
+        names = [f"table{i}" for i in range(6)]
+        for i, name in enumerate(names):
+            with open(os.path.join(self.test_dir, f"{name}.csv"), "w") as f:
+                f.write(f"R,V\n1-{i + 1},{name}\n")
+        with open(os.path.join(self.test_dir, "bad.csv"), "w") as f:
+            f.write("JustHeader\n")
+
+        with patch("loaders.ProcessPoolExecutor", wraps=ProcessPoolExecutor) as pool:
+            root_dir = CSVTableLoader(lazy=False).load(self.test_dir)
+        pool.assert_called_once()
+        tables = {t.name: t for t in root_dir.tables}
+        self.assertEqual(sorted(tables), names)
+        for i, name in enumerate(names):
+            self.assertEqual(tables[name].query(i + 1).content, [name])
+
+    def test_load_recursive_eager_thread_fallback(self):
+        for i in range(4):
+            with open(os.path.join(self.test_dir, f"table{i}.csv"), "w") as f:
+                f.write("R,V\n1,A\n")
+
+        with patch("loaders.ProcessPoolExecutor", side_effect=NotImplementedError):
+            root_dir = CSVTableLoader(lazy=False).load(self.test_dir)
+        self.assertEqual(len(root_dir.tables), 4)
+
+    def test_load_uses_cache(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        filepath = os.path.join(tables_dir, "table1.csv")
+        with open(filepath, "w") as f:
+            f.write("R,V\n1,A\n")
+
+        loader = CSVTableLoader(cache_dir=cache_dir, lazy=False)
+        first = loader.load(tables_dir)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+        with patch.object(loader, "_read_records") as mock_read_records:
+            second = loader.load(tables_dir)
+            mock_read_records.assert_not_called()
+        self.assertEqual(second.tables[0].name, first.tables[0].name)
+        self.assertEqual(second.tables[0].rows, first.tables[0].rows)
+
+    def test_load_lazy_uses_cache(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        with open(os.path.join(tables_dir, "table1.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+
+        loader = CSVTableLoader(cache_dir=cache_dir)
+        loader.load(tables_dir)
+        with patch.object(CSVTableLoader, "_iter_csv_paths") as walk:
+            second = loader.load(tables_dir)
+        walk.assert_not_called()
+        self.assertIsInstance(second.tables[0], LazyTable)
+        self.assertEqual(second.tables[0].query(1).content, ["A"])
+
+    def test_load_eager_ignores_lazy_cache(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        with open(os.path.join(tables_dir, "table1.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+
+        CSVTableLoader(cache_dir=cache_dir).load(tables_dir)
+        eager = CSVTableLoader(cache_dir=cache_dir, lazy=False).load(tables_dir)
+        self.assertIs(type(eager.tables[0]), Table)
+
+        # The parsed tree written by the eager load serves lazy loads too
+        lazy = CSVTableLoader(cache_dir=cache_dir).load(tables_dir)
+        self.assertIs(type(lazy.tables[0]), Table)
+        self.assertEqual(lazy.tables[0].query(1).content, ["A"])
+
+    def test_load_cache_invalidated_on_change(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        filepath = os.path.join(tables_dir, "table1.csv")
+        with open(filepath, "w") as f:
+            f.write("R,V\n1,A\n")
+
+        loader = CSVTableLoader(cache_dir=cache_dir, lazy=False)
+        loader.load(tables_dir)
+
+        with open(filepath, "w") as f:
+            f.write("R,V\n1,A\n2,B\n")
+        stat = os.stat(filepath)
+        os.utime(filepath, (stat.st_atime, stat.st_mtime + 10))
+
+        root_dir = loader.load(tables_dir)
+        self.assertEqual(len(root_dir.tables[0].rows), 2)
+        self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_load_cache_invalidated_by_older_file(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        filepath = os.path.join(tables_dir, "table1.csv")
+        with open(filepath, "w") as f:
+            f.write("R,V\n1,A\n")
+        file_stat = os.stat(filepath)
+        dir_stat = os.stat(tables_dir)
+
+        loader = CSVTableLoader(cache_dir=cache_dir, lazy=False)
+        loader.load(tables_dir)
+
+        # Restored from a backup: different content, older timestamp
+        with open(filepath, "w") as f:
+            f.write("R,V\n1,A\n2,B\n")
+        # ...while the newest timestamp in the tree stays what it was
+        newest_ns = max(file_stat.st_mtime_ns, dir_stat.st_mtime_ns)
+        os.utime(filepath, ns=(file_stat.st_atime_ns, newest_ns - 10**11))
+        os.utime(tables_dir, ns=(dir_stat.st_atime_ns, newest_ns))
+
+        root_dir = loader.load(tables_dir)
+        self.assertEqual(len(root_dir.tables[0].rows), 2)
+
+    def test_load_cache_ignores_hidden_entries(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        with open(os.path.join(tables_dir, "table1.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+
+        loader = CSVTableLoader(cache_dir=cache_dir)
+        key = loader._cache_key(tables_dir)
+        with open(os.path.join(tables_dir, ".table1.csv.swp"), "w") as f:
+            f.write("swap")
+        self.assertEqual(loader._cache_key(tables_dir), key)
+
+    def test_load_cache_skips_dangling_symlink(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        with open(os.path.join(tables_dir, "a.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+        os.symlink(os.path.join(tables_dir, "missing.csv"),
+                   os.path.join(tables_dir, "b.csv"))
+
+        root_dir = CSVTableLoader(cache_dir=cache_dir, lazy=False).load(tables_dir)
+        self.assertEqual([t.name for t in root_dir.tables], ["a"])
+
+    def test_load_cache_key_error_is_a_miss(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        tables_dir = os.path.join(self.test_dir, "tables")
+        os.mkdir(tables_dir)
+        with open(os.path.join(tables_dir, "a.csv"), "w") as f:
+            f.write("R,V\n1,A\n")
+
+        loader = CSVTableLoader(cache_dir=cache_dir, lazy=False)
+        with patch.object(loader, "_cache_key", side_effect=FileNotFoundError("gone")):
+            root_dir = loader.load(tables_dir)
+        self.assertEqual([t.name for t in root_dir.tables], ["a"])
+        self.assertFalse(os.path.exists(cache_dir))
+
     def test_load_nonexistent(self):
         # Should return a directory wrapper but with no content and probably logs an error
         # Implementation returns "root_dir" always, check error handling
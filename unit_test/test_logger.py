@@ -18,6 +18,10 @@
 
 import unittest
 import logging
+import logging.handlers
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import logger as logger_module
 from logger import setup_logging
 
 
@@ -28,10 +32,15 @@ class TestLogger(unittest.TestCase):
         self.assertEqual(logger.level, logging.DEBUG)
         self.assertTrue(logger.hasHandlers())
         
+        # Records go through a QueueHandler to the listener thread
+        queue_handlers = [h for h in logger.handlers if isinstance(h, logging.handlers.QueueHandler)]
+        self.assertTrue(queue_handlers)
+
         # Check handlers
-        # We expect a FileHandler and a StreamHandler
-        file_handlers = [h for h in logger.handlers if isinstance(h, logging.FileHandler)]
-        stream_handlers = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)]
+        # We expect a FileHandler and a StreamHandler behind the listener
+        listener_handlers = logger_module.g_log_listener.handlers
+        file_handlers = [h for h in listener_handlers if isinstance(h, logging.FileHandler)]
+        stream_handlers = [h for h in listener_handlers if isinstance(h, logging.StreamHandler)]
         
         self.assertTrue(file_handlers)
         self.assertTrue(stream_handlers)
@@ -40,5 +49,25 @@ class TestLogger(unittest.TestCase):
         logger = setup_logging(log_file="test.log", verbose=False)
         self.assertEqual(logger.level, logging.INFO)
 
+    def test_console_logging_suspended(self):
+        setup_logging(log_file="test.log", verbose=True)
+        console_handler = next(
+            h for h in logger_module.g_log_listener.handlers
+            if not isinstance(h, logging.FileHandler)
+        )
+        with logger_module.console_logging_suspended():
+            self.assertGreater(console_handler.level, logging.CRITICAL)
+        self.assertEqual(console_handler.level, logging.NOTSET)
+
+    def test_worker_process_skips_setup(self):
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            self.assertFalse(executor.submit(_worker_has_listener).result())
+
+
+def _worker_has_listener():
+    return logger_module.g_log_listener is not None
+
+
 if __name__ == '__main__':
     unittest.main()
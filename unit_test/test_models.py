@@ -16,8 +16,10 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import pickle
+import random
 import unittest
-from models import TableRow, Table, TableDirectory
+from models import TableRow, Table, TableDirectory, LazyTable, IntervalTree
 
 
 class TestTableRow(unittest.TestCase):
@@ -29,6 +31,30 @@ class TestTableRow(unittest.TestCase):
         self.assertFalse(row.matches(0))
         self.assertFalse(row.matches(6))
 
+    def test_slots(self):
+        row = TableRow(range_start=1, range_end=5, content=["Data"])
+        self.assertFalse(hasattr(row, "__dict__"))
+        with self.assertRaises(AttributeError):
+            row.extra = True
+
+
+class TestIntervalTree(unittest.TestCase):
+    def test_query_matches_brute_force(self):
+        rng = random.Random(42)
+        intervals = sorted(
+            (start, start + rng.randint(0, 30))
+            for start in (rng.randint(0, 200) for _ in range(100))
+        )
+        tree = IntervalTree(
+            [s for s, _ in intervals], [e for _, e in intervals], range(len(intervals))
+        )
+        for value in range(-5, 240):
+            expected = {i for i, (s, e) in enumerate(intervals) if s <= value <= e}
+            self.assertEqual(set(tree.query(value)), expected)
+
+    def test_query_empty(self):
+        self.assertEqual(IntervalTree([], [], []).query(1), [])
+
 
 class TestTable(unittest.TestCase):
     def setUp(self):
@@ -52,6 +78,86 @@ class TestTable(unittest.TestCase):
         row = self.table.query(11)
         self.assertIsNone(row)
 
+    def test_query_unsorted_rows_with_gaps(self):
+        table = Table("Unsorted", ["Range", "Result"], [
+            TableRow(10, 12, ["High"]),
+            TableRow(1, 3, ["Low"]),
+            TableRow(6, 6, ["Mid"]),
+        ])
+        self.assertEqual(table.query(2).content, ["Low"])
+        self.assertEqual(table.query(6).content, ["Mid"])
+        self.assertEqual(table.query(12).content, ["High"])
+        self.assertIsNone(table.query(0))
+        self.assertIsNone(table.query(4))
+        self.assertIsNone(table.query(13))
+
+    def test_query_overlapping_rows_first_match_wins(self):
+        table = Table("Overlap", ["Range", "Result"], [
+            TableRow(5, 20, ["Wide"]),
+            TableRow(1, 10, ["Narrow"]),
+        ])
+        self.assertEqual(table.query(3).content, ["Narrow"])
+        self.assertEqual(table.query(7).content, ["Wide"])
+        self.assertIsNone(table.query(21))
+
+    def test_query_wide_table_without_lookup_list(self):
+        table = Table("Wide", ["Range", "Result"], [
+            TableRow(1, 10, ["Low"]),
+            TableRow(50_000, 60_000, ["High"]),
+            TableRow(55_000, 70_000, ["Later"]),
+        ])
+        self.assertIsNone(table._lut)
+        self.assertEqual(table.query(5).content, ["Low"])
+        self.assertEqual(table.query(55_000).content, ["High"])
+        self.assertEqual(table.query(65_000).content, ["Later"])
+        self.assertIsNone(table.query(11))
+
+    def test_query_out_of_bounds_skips_search(self):
+        table = Table("Wide", ["Range", "Result"], [
+            TableRow(1, 10, ["Low"]),
+            TableRow(5, 20_000, ["High"]),
+        ])
+        table._tree = None
+        self.assertIsNone(table.query(0))
+        self.assertIsNone(table.query(20_001))
+
+    def test_query_cached(self):
+        table = Table("Wide", ["Range", "Result"], [
+            TableRow(1, 10, ["Low"]),
+            TableRow(50_000, 60_000, ["High"]),
+        ])
+        self.assertIs(table.query(3), table.query(3))
+        self.assertEqual(table.query.cache_info().hits, 1)
+
+    def test_query_lookup_list_not_cached(self):
+        self.assertIsNotNone(self.table._lut)
+        self.assertFalse(hasattr(self.table.query, 'cache_info'))
+        self.assertEqual(self.table.query(3).content, ["Low"])
+
+    def test_query_after_pickle(self):
+        table = pickle.loads(pickle.dumps(self.table))
+        self.assertEqual(table.query(7).content, ["High"])
+        self.assertIsNone(table.query(11))
+
+    def test_display_rows(self):
+        self.assertEqual(self.table.display_rows, [
+            ["1-4", "Low"], ["5", "Mid"], ["6-10", "High"]
+        ])
+        self.assertIs(self.table.display_rows, self.table.display_rows)
+
+    def test_render_rows(self):
+        lines = self.table.render_rows([4, 3])
+        self.assertEqual(lines, ["1-4  | Low", "5    | Mid", "6-10 | High"])
+        self.assertIs(self.table.render_rows([4, 3]), lines)
+        self.assertEqual(self.table.render_rows([4])[1], "5    | Mid")
+        self.assertNotIn('_rendered_rows', pickle.loads(pickle.dumps(self.table)).__dict__)
+
+    def test_render_rows_truncated(self):
+        lines = self.table.render_rows_truncated([4, 3], 6)
+        self.assertEqual(lines, ("1-4  |", "5    |", "6-10 |"))
+        self.assertIs(self.table.render_rows_truncated([4, 3], 6), lines)
+        self.assertEqual(self.table.render_rows_truncated([4, 3], 8)[2], "6-10 | H")
+
     def test_get_range_bounds(self):
         min_val, max_val = self.table.get_range_bounds()
         self.assertEqual(min_val, 1)
@@ -66,6 +172,43 @@ class TestTable(unittest.TestCase):
         self.assertIn("rows=3", repr(self.table))
 
 
+class TestLazyTable(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+
+    def _load(self):
+        self.calls += 1
+        return ["Range", "Result"], [TableRow(1, 2, ["Low"])]
+
+    def test_loads_on_first_access(self):
+        table = LazyTable("Lazy", self._load)
+        self.assertEqual(table.name, "Lazy")
+        self.assertEqual(self.calls, 0)
+
+        self.assertEqual(table.query(2).content, ["Low"])
+        self.assertEqual(table.headers, ["Range", "Result"])
+        self.assertEqual(self.calls, 1)
+        self.assertIs(type(table), Table)
+
+    def test_failed_build_gives_empty_table(self):
+        # Too large for the typed range columns
+        table = LazyTable("Huge", lambda: (["Range", "Result"], [TableRow(1, 2**64, ["X"])]))
+        self.assertIsNone(table.query(1))
+        self.assertEqual(table.rows, [])
+        self.assertEqual(table.get_range_bounds(), (0, 0))
+        self.assertIs(type(table), Table)
+
+    def test_pickle_does_not_load(self):
+        table = LazyTable("Lazy", _load_single_row)
+        copy = pickle.loads(pickle.dumps(table))
+        self.assertIsInstance(copy, LazyTable)
+        self.assertEqual(copy.get_range_bounds(), (1, 1))
+
+
+def _load_single_row():
+    return ["Range", "Result"], [TableRow(1, 1, ["Only"])]
+
+
 class TestTableDirectory(unittest.TestCase):
     def test_add_table(self):
         root = TableDirectory("root")
@@ -82,6 +225,26 @@ class TestTableDirectory(unittest.TestCase):
         self.assertEqual(root.subdirs["sub"], subdir)
         self.assertEqual(subdir.parent, root)
 
+    def test_sorted_subdir_names(self):
+        root = TableDirectory("root")
+        root.add_subdir(TableDirectory("b"))
+        root.add_subdir(TableDirectory("a"))
+        self.assertEqual(root.sorted_subdir_names, ["a", "b"])
+        self.assertIs(root.sorted_subdir_names, root.sorted_subdir_names)
+
+        root.add_subdir(TableDirectory("0"))
+        self.assertEqual(root.sorted_subdir_names, ["0", "a", "b"])
+
+    def test_items_cache_reset_on_change(self):
+        root = TableDirectory("root")
+        root._items_cache = []
+        root.add_table(Table("t1", [], []))
+        self.assertIsNone(root._items_cache)
+
+        root._items_cache = []
+        root.add_subdir(TableDirectory("sub"))
+        self.assertIsNone(root._items_cache)
+
 
 if __name__ == '__main__':
     unittest.main()
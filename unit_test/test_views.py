@@ -0,0 +1,95 @@
+# unit_test/test_views.py
+#
+# Copyright (C) 2026 Sergio Borghese <s.borghese@netresults.it>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+import curses
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from views import DEFAULT_THEME, load_theme, _resolve_theme_pairs
+
+
+DEFAULT_PAIRS = (
+    (curses.COLOR_CYAN, curses.COLOR_BLACK),
+    (curses.COLOR_GREEN, curses.COLOR_BLACK),
+    (curses.COLOR_YELLOW, curses.COLOR_BLACK),
+    (curses.COLOR_WHITE, curses.COLOR_BLUE),
+)
+
+
+class TestResolveThemePairs(unittest.TestCase):
+    def test_default_theme(self):
+        self.assertEqual(_resolve_theme_pairs(DEFAULT_THEME), DEFAULT_PAIRS)
+
+    def test_missing_colors_use_defaults(self):
+        self.assertEqual(_resolve_theme_pairs({}), DEFAULT_PAIRS)
+
+    def test_unknown_color_names_use_defaults(self):
+        theme = {"colors": {
+            "table": {"foreground": "pink", "background": "red"},
+            "status_bar": {"background": "nope"},
+        }}
+        self.assertEqual(_resolve_theme_pairs(theme), (
+            (curses.COLOR_CYAN, curses.COLOR_BLACK),
+            (curses.COLOR_GREEN, curses.COLOR_RED),
+            (curses.COLOR_YELLOW, curses.COLOR_BLACK),
+            (curses.COLOR_WHITE, curses.COLOR_BLUE),
+        ))
+
+
+class TestLoadTheme(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _write(self, name, data):
+        path = os.path.join(self.test_dir, name)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        return path
+
+    def test_load_theme_file(self):
+        path = self._write("theme.json", {
+            "name": "Paper",
+            "colors": {"directory": {"foreground": "blue", "background": "white"}},
+        })
+        theme = load_theme(path)
+        self.assertEqual(theme["name"], "Paper")
+        self.assertEqual(theme["_resolved_pairs"][0], (curses.COLOR_BLUE, curses.COLOR_WHITE))
+        self.assertEqual(theme["_resolved_pairs"][1:], DEFAULT_PAIRS[1:])
+
+    def test_missing_file_uses_default(self):
+        theme = load_theme(os.path.join(self.test_dir, "missing.json"))
+        self.assertEqual(theme["name"], "Default Dark")
+        self.assertEqual(theme["_resolved_pairs"], DEFAULT_PAIRS)
+
+    def test_non_object_uses_default(self):
+        theme = load_theme(self._write("list.json", []))
+        self.assertEqual(theme["name"], "Default Dark")
+        self.assertEqual(theme["_resolved_pairs"], DEFAULT_PAIRS)
+
+    def test_invalid_json_uses_default(self):
+        path = os.path.join(self.test_dir, "broken.json")
+        with open(path, "w") as f:
+            f.write("{not json")
+        self.assertEqual(load_theme(path)["name"], "Default Dark")
+
+
+if __name__ == '__main__':
+    unittest.main()
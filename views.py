@@ -11,7 +11,7 @@ __status__      = "Development"
 
 import sys
 import os
-import json
+import functools
 import curses
 from typing import List, Tuple, Any, Optional, Dict
 from models import Table, TableDirectory
@@ -31,36 +31,79 @@ COLOR_MAP = {
 }
 
 
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+
+# Default theme if file not found
+DEFAULT_THEME = {
+    "name": "Default Dark",
+    "background": "black",
+    "colors": {
+        "directory": {"foreground": "cyan", "background": "black"},
+        "table": {"foreground": "green", "background": "black"},
+        "logo": {"foreground": "yellow", "background": "black"},
+        "status_bar": {"foreground": "white", "background": "blue"},
+        "selected": {"foreground": "black", "background": "white"},
+        "header": {"foreground": "white", "background": "black"}
+    }
+}
+
+# Theme entries backing curses color pairs 1, 2, ... with their default colors
+THEME_PAIRS = (
+    ('directory', 'cyan', 'black'),
+    ('table', 'green', 'black'),
+    ('logo', 'yellow', 'black'),
+    ('status_bar', 'white', 'blue'),
+)
+
+STATUS_KEYS = "Keys: ↑/↓ Move, Enter Select, b Back, d Dump, q Quit"
+STATUS_KEYS_LEN = len(STATUS_KEYS)
+
+
+def _resolve(path: Optional[str], name: str) -> str:
+    """Absolute path of a resource file, defaulting to resources/<name>."""
+    if path is None:
+        return os.path.join(RESOURCES_DIR, name)
+    return os.path.abspath(path)
+
+
 def load_theme(theme_path: str = None) -> Dict:
     """Load theme configuration from JSON file."""
-    if theme_path is None:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        theme_path = os.path.join(base_dir, 'resources', 'theme.json')
-    
-    # Default theme if file not found
-    default_theme = {
-        "name": "Default Dark",
-        "background": "black",
-        "colors": {
-            "directory": {"foreground": "cyan", "background": "black"},
-            "table": {"foreground": "green", "background": "black"},
-            "logo": {"foreground": "yellow", "background": "black"},
-            "status_bar": {"foreground": "white", "background": "blue"},
-            "selected": {"foreground": "black", "background": "white"},
-            "header": {"foreground": "white", "background": "black"}
-        }
-    }
-    
+    return _load_theme(_resolve(theme_path, 'theme.json'))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_theme(theme_path: str) -> Dict:
+    """Read and parse a theme file once per process."""
+    theme = DEFAULT_THEME
     if os.path.exists(theme_path):
+        # Only pay for importing json when there is a theme to parse
+        import json
         try:
             with open(theme_path, 'r', encoding='utf-8') as f:
-                theme = json.load(f)
+                loaded = json.load(f)
+            if isinstance(loaded, dict):
+                theme = loaded
                 g_logger.info(f"Loaded theme: {theme.get('name', 'Unknown')}")
-                return theme
+            else:
+                g_logger.warning(f"Ignoring theme {theme_path}: expected a JSON object")
         except Exception as e:
             g_logger.warning(f"Failed to load theme from {theme_path}: {e}")
     
-    return default_theme
+    # Resolve color names once so init_color_pairs is a plain loop
+    return dict(theme, _resolved_pairs=_resolve_theme_pairs(theme))
+
+
+def _resolve_theme_pairs(theme: Dict) -> Tuple[Tuple[int, int], ...]:
+    """Return the (foreground, background) colors of pairs 1, 2, ... for a theme."""
+    colors = theme.get('colors', {})
+    pairs = []
+    for key, default_fg, default_bg in THEME_PAIRS:
+        entry = colors.get(key, {})
+        pairs.append((
+            COLOR_MAP.get(entry.get('foreground', default_fg), COLOR_MAP[default_fg]),
+            COLOR_MAP.get(entry.get('background', default_bg), COLOR_MAP[default_bg]),
+        ))
+    return tuple(pairs)
 
 
 def init_color_pairs(theme: Dict, stdscr=None):
@@ -70,124 +113,130 @@ def init_color_pairs(theme: Dict, stdscr=None):
     
     curses.start_color()
     
+    # Black backgrounds use the terminal's own background (-1) where
+    # supported, so those cells need no explicit color
+    try:
+        curses.use_default_colors()
+        default_bg = -1
+    except curses.error:
+        default_bg = curses.COLOR_BLACK
+    
     # Set background color if specified and stdscr is provided
     if stdscr:
-        bg_color_name = theme.get('background', 'black')
-        bg_color = COLOR_MAP.get(bg_color_name, curses.COLOR_BLACK)
+        bg_color = COLOR_MAP.get(theme.get('background', 'black'), curses.COLOR_BLACK)
+        if bg_color == curses.COLOR_BLACK:
+            bg_color = default_bg
         
-        # Create a color pair for background (pair 0 is reserved, use pair 5)
-        try:
-            curses.init_pair(5, curses.COLOR_WHITE, bg_color)
-            stdscr.bkgd(' ', curses.color_pair(5))
-        except:
-            pass
-    
-    colors = theme.get('colors', {})
-    
-    # Pair 1: Directories
-    dir_fg = COLOR_MAP.get(colors.get('directory', {}).get('foreground', 'cyan'), curses.COLOR_CYAN)
-    dir_bg = COLOR_MAP.get(colors.get('directory', {}).get('background', 'black'), curses.COLOR_BLACK)
-    curses.init_pair(1, dir_fg, dir_bg)
-    
-    # Pair 2: Tables
-    tbl_fg = COLOR_MAP.get(colors.get('table', {}).get('foreground', 'green'), curses.COLOR_GREEN)
-    tbl_bg = COLOR_MAP.get(colors.get('table', {}).get('background', 'black'), curses.COLOR_BLACK)
-    curses.init_pair(2, tbl_fg, tbl_bg)
-    
-    # Pair 3: Logo
-    logo_fg = COLOR_MAP.get(colors.get('logo', {}).get('foreground', 'yellow'), curses.COLOR_YELLOW)
-    logo_bg = COLOR_MAP.get(colors.get('logo', {}).get('background', 'black'), curses.COLOR_BLACK)
-    curses.init_pair(3, logo_fg, logo_bg)
+        # Create a color pair for background (pair 0 is reserved, use pair 5).
+        # Not needed when the terminal background shows through anyway.
+        if bg_color != -1:
+            try:
+                curses.init_pair(5, curses.COLOR_WHITE, bg_color)
+                stdscr.bkgd(' ', curses.color_pair(5))
+            except:
+                pass
     
-    # Pair 4: Status bar
-    status_fg = COLOR_MAP.get(colors.get('status_bar', {}).get('foreground', 'white'), curses.COLOR_WHITE)
-    status_bg = COLOR_MAP.get(colors.get('status_bar', {}).get('background', 'blue'), curses.COLOR_BLUE)
-    curses.init_pair(4, status_fg, status_bg)
+    # Pairs 1-4 as resolved by load_theme
+    pairs = theme.get('_resolved_pairs') or _resolve_theme_pairs(theme)
+    for pair_number, (fg, bg) in enumerate(pairs, 1):
+        curses.init_pair(pair_number, fg, default_bg if bg == curses.COLOR_BLACK else bg)
 
 
 def print_logo(logo_path: str = None):
     """Print the ASCII logo."""
-    if logo_path is None:
-        # Default to resources/logo.ascii.txt relative to this script
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        logo_path = os.path.join(base_dir, 'resources', 'logo.ascii.txt')
+    # Default to resources/logo.ascii.txt relative to this script
+    logo_path = _resolve(logo_path, 'logo.ascii.txt')
 
-    if os.path.exists(logo_path):
-        try:
-            with open(logo_path, 'r', encoding='utf-8') as f:
-                print(f.read())
-        except Exception as e:
-            g_logger.warning(f"Failed to load logo from {logo_path}: {e}")
-    else:
+    logo_text = _read_logo_text(logo_path)
+    if logo_text is None:
         g_logger.warning(f"Logo file not found: {logo_path}")
+    elif logo_text:
+        print(logo_text)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_logo_text(logo_path: str) -> Optional[str]:
+    """Read a logo file once per process.
+
+    Returns None if the file does not exist and '' if it cannot be read.
+    """
+    if not os.path.exists(logo_path):
+        return None
+    try:
+        with open(logo_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        g_logger.warning(f"Failed to load logo from {logo_path}: {e}")
+        return ""
+
 
+def draw_status_bar(stdscr, path_str: str, table_name: str, width: int, attr: int = curses.A_REVERSE):
+    """Draw the status bar at the bottom of the screen.
 
-def draw_status_bar(stdscr, path_str: str, table_name: str, width: int, use_colors: bool = True):
-    """Draw the status bar at the bottom of the screen."""
+    `attr` is the precomputed bar attribute, the status color pair when the
+    terminal has colors.
+    """
     height, _ = stdscr.getmaxyx()
     status_y = height - 1
-    
-    # Ensure strings don't exceed width
+    try:
+        # Paint the bar background in one call, then the text segments on it
+        stdscr.hline(status_y, 0, ord(' ') | attr, width - 1)
+        for x, text in _status_segments(path_str, table_name, width):
+            stdscr.addstr(status_y, x, text, attr)
+    except curses.error:
+        pass
+
+
+@functools.lru_cache(maxsize=32)
+def _status_segments(path_str: str, table_name: str, width: int) -> Tuple[Tuple[int, str], ...]:
+    """Lay out the status bar text as (column, text) pairs within width - 1."""
     # Layout: [ PATH ... ] | [ TABLE ... ] | [ COMMANDS ]
+    # 4 for separators, 10 as a minimal fallback
+    part_w = max(width - STATUS_KEYS_LEN - 4, 10) // 2
     
-    # Calculate available space
-    cmd_str = "Keys: ↑/↓ Move, Enter Select, b Back, d Dump, q Quit"
-    cmd_len = len(cmd_str)
-    
-    # Basic truncation if needed (unlikely for typical terms but good practice)
-    if cmd_len >= width:
-        cmd_str = cmd_str[:width-1]
-    
-    remaining_w = width - cmd_len - 4 # 4 for separators
-    if remaining_w < 10:
-        remaining_w = 10 # minimal fallback
-        
-    part_w = remaining_w // 2
-    
-    path_display = f"Path: {path_str}"
+    path_display = "Path: " + path_str
     if len(path_display) > part_w:
         path_display = "..." + path_display[-(part_w-3):]
-    else:
-        path_display = path_display.ljust(part_w)
         
-    table_display = f"Table: {table_name}"
+    table_display = "Table: " + table_name
     if len(table_display) > part_w:
         table_display = table_display[:part_w-3] + "..."
-    else:
-        table_display = table_display.ljust(part_w)
 
-    status_line = f"{path_display} | {table_display} | {cmd_str}"
-    
-    # Pad to full width
-    if len(status_line) < width:
-        status_line += " " * (width - len(status_line) - 1)
-        
-    try:
-        if use_colors and curses.has_colors():
-            stdscr.attron(curses.color_pair(4))
-            stdscr.addstr(status_y, 0, status_line[:width-1])
-            stdscr.attroff(curses.color_pair(4))
-        else:
-            stdscr.attron(curses.A_REVERSE)
-            stdscr.addstr(status_y, 0, status_line[:width-1])
-            stdscr.attroff(curses.A_REVERSE)
-    except curses.error:
-        pass
+    segments = (
+        (0, path_display),
+        (part_w, " | "),
+        (part_w + 3, table_display),
+        (2 * part_w + 3, " | "),
+        (2 * part_w + 6, STATUS_KEYS),
+    )
+    # Clip to the line like a single addstr of width - 1 characters would
+    limit = width - 1
+    return tuple((x, text[:limit - x]) for x, text in segments if x < limit)
+
+
+def get_items_for_dir(current_dir: TableDirectory) -> List[Tuple[str, str, Any, str, int]]:
+    """Return list of (display_name, type, object, label, attr_index) for the directory.
 
+    `label` is the text shown in the list and `attr_index` selects its
+    color: 1 for directories, 2 for tables (the curses pair numbers).
+    The list is cached on the directory until a table or subdirectory is
+    added to it.
+    """
+    if current_dir._items_cache is not None:
+        return current_dir._items_cache
 
-def get_items_for_dir(current_dir: TableDirectory) -> List[Tuple[str, str, Any]]:
-    """Return list of (display_name, type, object) for the directory."""
     items = []
     
     if current_dir.parent:
-        items.append(("..", "DIR_UP", current_dir.parent))
+        items.append(("..", "DIR_UP", current_dir.parent, "[..]", 1))
         
-    for sub_name in sorted(current_dir.subdirs.keys()):
-        items.append((sub_name, "DIR", current_dir.subdirs[sub_name]))
+    for sub_name in current_dir.sorted_subdir_names:
+        items.append((sub_name, "DIR", current_dir.subdirs[sub_name], f"[{sub_name}]", 1))
         
     for table in current_dir.tables:
-        items.append((table.name, "TABLE", table))
+        items.append((table.name, "TABLE", table, table.name, 2))
         
+    current_dir._items_cache = items
     return items
 
 
@@ -197,12 +246,7 @@ def calculate_column_widths(table: Table) -> List[int]:
     widths = [len(h) for h in table.headers]
     
     # Check all rows and update if needed
-    for row in table.rows:
-        r_start = row.range_start
-        r_end = row.range_end
-        range_disp = f"{r_start}" if r_start == r_end else f"{r_start}-{r_end}"
-        full_row = [range_disp] + row.content
-        
+    for full_row in table.display_rows:
         for i, cell in enumerate(full_row):
             if i < len(widths):
                 widths[i] = max(widths[i], len(str(cell)))
@@ -228,14 +272,9 @@ def dump_table_view(stdscr, table: Table):
     # Calculate column widths
     col_widths = calculate_column_widths(table)
     
-    # Prepare all rows
-    all_rows = []
-    for row in table.rows:
-        r_start = row.range_start
-        r_end = row.range_end
-        range_disp = f"{r_start}" if r_start == r_end else f"{r_start}-{r_end}"
-        full_row = [range_disp] + row.content
-        all_rows.append(format_table_row(full_row, col_widths))
+    # Prepare all rows, already cut to the screen width
+    all_rows = table.render_rows_truncated(col_widths, width-1)
+    headers_str = format_table_row(table.headers, col_widths)[:width-1]
     
     # Calculate pagination
     title_lines = 2  # Title + blank line
@@ -247,15 +286,17 @@ def dump_table_view(stdscr, table: Table):
     current_page = 0
     total_pages = (total_rows + available_height - 1) // available_height if available_height > 0 else 1
     
+    title = f"Table Dump: {table.name}"
+    addstr = stdscr.addstr
+    getch = stdscr.getch
+    
     while True:
         stdscr.clear()
         
-        title = f"Table Dump: {table.name}"
-        stdscr.addstr(0, 0, title, curses.A_BOLD)
+        addstr(0, 0, title, curses.A_BOLD)
         
-        # Format and display header
-        headers_str = format_table_row(table.headers, col_widths)
-        stdscr.addstr(2, 0, headers_str[:width-1], curses.A_UNDERLINE)
+        # Display header
+        addstr(2, 0, headers_str, curses.A_UNDERLINE)
         
         # Display current page of rows
         start_idx = current_page * available_height
@@ -265,7 +306,7 @@ def dump_table_view(stdscr, table: Table):
         for i in range(start_idx, end_idx):
             if row_y >= height - 1:
                 break
-            stdscr.addstr(row_y, 0, all_rows[i][:width-1])
+            addstr(row_y, 0, all_rows[i])
             row_y += 1
         
         # Status bar
@@ -275,14 +316,15 @@ def dump_table_view(stdscr, table: Table):
             status = "Press any key to return..."
         
         try:
-            stdscr.addstr(height-1, 0, status, curses.A_REVERSE)
+            addstr(height-1, 0, status, curses.A_REVERSE)
         except curses.error:
             pass
             
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
         
         # Handle input
-        key = stdscr.getch()
+        key = getch()
         
         if key == ord('q'):
             break
@@ -303,11 +345,55 @@ def dump_table_view(stdscr, table: Table):
             break
 
 
+# _read_roll results other than a number or None
+_ROLL_RESIZED = object()
+_ROLL_INVALID = object()
+
+
+def _read_roll(stdscr, y: int, x: int):
+    """Read a dice roll typed at (y, x), one key at a time.
+
+    Digits are echoed and accumulated straight into an int. Returns the
+    number on Enter, None if 'q' was pressed, _ROLL_RESIZED when the
+    terminal was resized and the prompt must be redrawn, or _ROLL_INVALID
+    for any other printable character.
+    """
+    value = 0
+    digits = 0
+    max_digits = max(stdscr.getmaxyx()[1] - x - 1, 0)
+    get_wch = stdscr.get_wch
+    addch = stdscr.addch
+    while True:
+        try:
+            key = get_wch()
+        except curses.error:
+            continue
+        
+        if key == 'q' or key == 'Q':
+            return None
+        elif key == curses.KEY_RESIZE:
+            return _ROLL_RESIZED
+        elif key == '\n' or key == '\r' or key == curses.KEY_ENTER:
+            if digits:
+                return value
+        elif key == '\b' or key == '\x7f' or key == curses.KEY_BACKSPACE:
+            if digits:
+                digits -= 1
+                value //= 10
+                addch(y, x + digits, ' ')
+                stdscr.move(y, x + digits)
+        elif isinstance(key, str) and '0' <= key <= '9':
+            if digits < max_digits:
+                value = value * 10 + ord(key) - 48
+                addch(y, x + digits, key)
+                digits += 1
+        elif isinstance(key, str) and key.isprintable():
+            return _ROLL_INVALID
+
+
 def query_table_view(stdscr, table: Table):
     """View to query a specific table."""
     # Simple query mode: Input loop
-    curses.echo()
-    
     while True:
         stdscr.clear()
         height, width = stdscr.getmaxyx()
@@ -319,41 +405,35 @@ def query_table_view(stdscr, table: Table):
         prompt = f"Enter dice roll ({min_val}-{max_val}) or 'q' to quit: "
         stdscr.addstr(2, 0, prompt)
         
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
         
-        try:
-            # Get input string
-            user_input_bytes = stdscr.getstr(2, len(prompt))
-            user_input = user_input_bytes.decode('utf-8').strip()
-        except curses.error:
-            continue
-            
-        if user_input.lower() == 'q':
+        value = _read_roll(stdscr, 2, len(prompt))
+        if value is None:
             break
+        if value is _ROLL_RESIZED:
+            continue
             
         result_text = []
-        try:
-            value = int(user_input)
-            row = table.query(value)
-            
-            if row:
-                # Calculate column widths for this table
-                col_widths = calculate_column_widths(table)
-                
-                headers_str = format_table_row(table.headers, col_widths)
-                result_text.append(headers_str)
-                result_text.append("-" * len(headers_str))
-                
-                r_start = row.range_start
-                r_end = row.range_end
-                range_disp = f"{r_start}" if r_start == r_end else f"{r_start}-{r_end}"
-                full_row = [range_disp] + row.content
-                result_text.append(format_table_row(full_row, col_widths))
-            else:
-                result_text.append("No match found.")
-                
-        except ValueError:
+        valid = value is not _ROLL_INVALID
+        row = table.query(value) if valid and min_val <= value <= max_val else None
+        
+        if not valid:
             result_text.append("Invalid input. Integers only.")
+        elif row:
+            # Calculate column widths for this table
+            col_widths = calculate_column_widths(table)
+            
+            headers_str = format_table_row(table.headers, col_widths)
+            result_text.append(headers_str)
+            result_text.append("-" * len(headers_str))
+            
+            full_row = [row.range_display()] + row.content
+            result_text.append(format_table_row(full_row, col_widths))
+        elif min_val <= value <= max_val:
+            result_text.append("No match found.")
+        else:
+            result_text.append(f"Out of range. Roll between {min_val} and {max_val}.")
             
         # Show result
         y_off = 4
@@ -362,26 +442,21 @@ def query_table_view(stdscr, table: Table):
             y_off += 1
             
         stdscr.addstr(height-1, 0, "Press any key to continue...", curses.A_REVERSE)
-        curses.noecho()
+        stdscr.noutrefresh()
+        curses.doupdate()
         stdscr.getch()
-        curses.echo()
 
-    curses.noecho()
 
-
-def load_logo_lines(logo_path: str = None) -> List[str]:
+def load_logo_lines(logo_path: str = None) -> Tuple[str, ...]:
     """Load logo lines from file."""
-    if logo_path is None:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        logo_path = os.path.join(base_dir, 'resources', 'logo.ascii.txt')
-    
-    if os.path.exists(logo_path):
-        try:
-            with open(logo_path, 'r', encoding='utf-8') as f:
-                return f.read().splitlines()
-        except Exception as e:
-            g_logger.warning(f"Failed to load logo from {logo_path}: {e}")
-    return []
+    return _split_logo_lines(_resolve(logo_path, 'logo.ascii.txt'))
+
+
+@functools.lru_cache(maxsize=4)
+def _split_logo_lines(logo_path: str) -> Tuple[str, ...]:
+    """Logo lines split once per process; a tuple, so callers share it safely."""
+    logo_text = _read_logo_text(logo_path)
+    return tuple(logo_text.splitlines()) if logo_text else ()
 
 
 def run_tui(stdscr, root_dir: TableDirectory, logo_path: str = None, theme_path: str = None):
@@ -399,96 +474,172 @@ def run_tui(stdscr, root_dir: TableDirectory, logo_path: str = None, theme_path:
     selected_idx = 0
     path_stack = [root_dir.name]
     logo_lines = load_logo_lines(logo_path)
+
+    # Resolve attributes once; the loop below redraws on every keystroke.
+    addstr = stdscr.addstr
+    attrset = stdscr.attrset
+    chgat = stdscr.chgat
+    getch = stdscr.getch
+    getmaxyx = stdscr.getmaxyx
+    KEY_UP = curses.KEY_UP
+    KEY_DOWN = curses.KEY_DOWN
+    KEY_ENTER = curses.KEY_ENTER
+    A_NORMAL = curses.A_NORMAL
+    A_BOLD = curses.A_BOLD
+    A_REVERSE = curses.A_REVERSE
+    attr_dir = curses.color_pair(1) if use_colors else A_NORMAL
+    attr_table = curses.color_pair(2) if use_colors else A_NORMAL
+    attr_logo = (curses.color_pair(3) | A_BOLD) if use_colors else A_BOLD
+    attr_status = curses.color_pair(4) if use_colors else A_REVERSE
+
+    # The logo never changes: render it once into a pad and copy the
+    # visible part onto the screen on full repaints.
+    logo_pad = None
+    if logo_lines:
+        logo_width = max(len(line) for line in logo_lines) + 1
+        logo_pad = curses.newpad(len(logo_lines) + 1, logo_width)
+        logo_pad.bkgd(' ', stdscr.getbkgd())
+        for y, line in enumerate(logo_lines):
+            try:
+                logo_pad.addstr(y, 0, line, attr_logo)
+            except curses.error:
+                pass
+    
+    item_attrs = (A_NORMAL, attr_dir, attr_table)
+
+    def item_look(i):
+        """Return the on-screen text and attribute of list entry i."""
+        label, attr_index = items[i][3:]
+        attr = item_attrs[attr_index]
+        if i == selected_idx:
+            attr |= A_REVERSE
+        return label[:width-1], attr
+
+    def draw_item(i):
+        """Draw list entry i if it is on screen."""
+        nonlocal last_attr
+        if not start_idx <= i < min(len(items), start_idx + max_display_items):
+            return
+        text, attr = item_look(i)
+        # Consecutive entries mostly share an attribute; only switch the
+        # window attribute when it changes.
+        if attr != last_attr:
+            attrset(attr)
+            last_attr = attr
+        try:
+            addstr(list_y + i - start_idx, 0, text)
+        except curses.error:
+            pass
+
+    def restyle_item(i):
+        """Change the attribute of list entry i without rewriting its text."""
+        if not start_idx <= i < min(len(items), start_idx + max_display_items):
+            return
+        text, attr = item_look(i)
+        try:
+            chgat(list_y + i - start_idx, 0, len(text), attr)
+        except curses.error:
+            pass
+
+    # Only repaint the whole screen when the layout changes (directory,
+    # scroll position, terminal size or a sub-view took over). Moving the
+    # selection repaints the two affected rows and the status bar.
+    redraw_all = True
+    items_dir = None
+    prev_size = None
+    start_idx = 0
+    prev_start_idx = -1
+    prev_selected_idx = 0
+    dirty = True
     
     while True:
-        stdscr.clear()
-        height, width = stdscr.getmaxyx()
+        # Keys the browser ignores leave the screen as it is
+        if dirty:
+            # Get Items, only when the directory changed
+            if current_dir is not items_dir:
+                items = get_items_for_dir(current_dir)
+                items_dir = current_dir
         
-        # Get Items
-        items = get_items_for_dir(current_dir)
+            height, width = getmaxyx()
+            if (height, width) != prev_size:
+                prev_size = (height, width)
+                redraw_all = True
+                # Layout: logo, a blank line, the header, then the list
+                logo_rows = min(len(logo_lines), height // 3)
+                logo_y = logo_rows + 1 if logo_lines else 0
+                list_y = logo_y + 1
+                max_display_items = height - list_y - 2  # Adjust for logo, header, and status bar
+                # A taller window can show more of the list: do not leave
+                # blank rows below its end
+                start_idx = max(0, min(start_idx, len(items) - max_display_items))
         
-        # Ensure selection is valid
-        if selected_idx >= len(items):
-            selected_idx = len(items) - 1
-        if selected_idx < 0:
-            selected_idx = 0
-            
-        # Draw Logo
-        logo_y = 0
-        if logo_lines:
-            for line in logo_lines[:min(len(logo_lines), height // 3)]:
-                try:
-                    attr = curses.A_BOLD
-                    if curses.has_colors():
-                        attr = curses.color_pair(3) | curses.A_BOLD
-                    stdscr.addstr(logo_y, 0, line[:width-1], attr)
-                except curses.error:
-                    pass
-                logo_y += 1
-            logo_y += 1  # Extra spacing
+            # Ensure selection is valid
+            if selected_idx >= len(items):
+                selected_idx = len(items) - 1
+            if selected_idx < 0:
+                selected_idx = 0
         
-        # Draw Header
-        header = f"Browsing: {'/'.join(path_stack)}"
-        stdscr.addstr(logo_y, 0, header, curses.A_BOLD)
-        logo_y += 1
+            # Scroll only when the selection leaves the visible window
+            if selected_idx < start_idx:
+                start_idx = selected_idx
+            elif selected_idx >= start_idx + max_display_items:
+                start_idx = selected_idx - max_display_items + 1
+            if start_idx != prev_start_idx:
+                redraw_all = True
         
-        # Draw List
-        max_display_items = height - logo_y - 2  # Adjust for logo, header, and status bar
-        start_idx = 0
-        if selected_idx >= max_display_items:
-            start_idx = selected_idx - max_display_items + 1
+            if redraw_all:
+                stdscr.erase()
             
-        list_y = logo_y
-        for i in range(start_idx, min(len(items), start_idx + max_display_items)):
-            name, type_, obj = items[i]
+                # Draw Header
+                header = f"Browsing: {'/'.join(path_stack)}"
+                addstr(logo_y, 0, header, A_BOLD)
             
-            display_str = name
-            attr = curses.A_NORMAL
+                # Draw List
+                last_attr = A_NORMAL
+                for i in range(start_idx, min(len(items), start_idx + max_display_items)):
+                    draw_item(i)
+                # Leave the window attribute clean for the other views
+                attrset(A_NORMAL)
+            elif prev_selected_idx != selected_idx:
+                restyle_item(prev_selected_idx)
+                restyle_item(selected_idx)
+            prev_start_idx = start_idx
+            prev_selected_idx = selected_idx
             
-            if type_ == "DIR" or type_ == "DIR_UP":
-                display_str = f"[{name}]"
-                if curses.has_colors():
-                    attr = curses.color_pair(1)
-            elif type_ == "TABLE":
-                display_str = f"{name}"
-                if curses.has_colors():
-                    attr = curses.color_pair(2)
-            
-            if i == selected_idx:
-                attr |= curses.A_REVERSE
-                
-            try:
-                stdscr.addstr(list_y, 0, display_str[:width-1], attr)
-            except curses.error:
-                pass
-            list_y += 1
-            
-        # Draw Status Bar
-        selected_obj_name = "None"
-        if items:
-            selected_obj_name = items[selected_idx][0]
+            # Draw Status Bar
+            selected_obj_name = "None"
+            if items:
+                selected_obj_name = items[selected_idx][0]
             
-        draw_status_bar(stdscr, "/".join(path_stack), selected_obj_name, width, use_colors)
+            draw_status_bar(stdscr, "/".join(path_stack), selected_obj_name, width, attr_status)
         
-        stdscr.refresh()
+            # Push all changes to the terminal in one write. The logo pad goes
+            # after stdscr so the erased rows underneath do not cover it.
+            stdscr.noutrefresh()
+            if redraw_all and logo_pad is not None and logo_rows:
+                logo_pad.noutrefresh(0, 0, 0, 0, logo_rows - 1, min(width - 1, logo_width) - 1)
+            curses.doupdate()
+            redraw_all = False
         
         # Input Handling
-        key = stdscr.getch()
+        key = getch()
+        dirty = True
         
-        if key == curses.KEY_UP:
+        if key == KEY_UP:
             selected_idx = max(0, selected_idx - 1)
-        elif key == curses.KEY_DOWN:
+        elif key == KEY_DOWN:
             selected_idx = min(len(items) - 1, selected_idx + 1)
         elif key == ord('q'):
             break
         elif key == ord('d'):
             if items:
-                _, type_, obj = items[selected_idx]
+                _, type_, obj = items[selected_idx][:3]
                 if type_ == "TABLE":
                     dump_table_view(stdscr, obj)
-        elif key == ord('\n') or key == curses.KEY_ENTER:
+                    redraw_all = True
+        elif key == ord('\n') or key == KEY_ENTER:
             if items:
-                name, type_, obj = items[selected_idx]
+                name, type_, obj = items[selected_idx][:3]
                 
                 if type_ == "DIR_UP":
                     # Go up
@@ -496,11 +647,16 @@ def run_tui(stdscr, root_dir: TableDirectory, logo_path: str = None, theme_path:
                         current_dir = current_dir.parent
                         path_stack.pop()
                         selected_idx = 0
+                        redraw_all = True
                 elif type_ == "DIR":
                     # Go down
                     current_dir = obj
                     path_stack.append(name)
                     selected_idx = 0
+                    redraw_all = True
                 elif type_ == "TABLE":
                     # Query Table
                     query_table_view(stdscr, obj)
+                    redraw_all = True
+        elif key != curses.KEY_RESIZE:
+            dirty = False